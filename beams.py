@@ -1,5 +1,4 @@
 import math
-from functools import cached_property
 
 # Cost of electricity in [$/J] (converted from [$/kWh])
 ELECTRICITY_COST = 0.314 / 10**3 / 3600
@@ -9,6 +8,9 @@ class Material:
     Class to store the various properties of a material. Could be a dict,
     but where's the fun in that?
     """
+    __slots__ = ("name", "yield_stress", "modulus", "elongation", "density",
+                 "price", "energy_density")
+
     electricity_cost = ELECTRICITY_COST
 
     def __init__(self, name, yield_stress, modulus, elongation, density, price, energy_density):
@@ -31,20 +33,33 @@ class Beam:
     any confusion with unit conversion!
 
     In order to make the best use of this, subclass it for your chosen 
-    cross-sectional shape, and add properties to determine:
+    cross-sectional shape, work out the following in the initialiser of your
+    subclass and pass them through to `Beam.__init__()`:
+        * `length`
         * `area`
         * `second_moment_of_area_xx`
         * `second_moment_of_area_yy`
 
-    Some other attributes should be included in the initialiser of your subclass:
-        * `length`
-        * 
+    These (plus `squash_load`) are just a couple of multiplies each, so they're
+    stored as plain attributes rather than being recomputed/cached lazily.
+    Everything else is a plain property, since every class here uses
+    `__slots__` (which `cached_property` can't work with) to keep each beam
+    small. Remember to add `__slots__` for your subclass's own dimensions too!
     """
 
-    def __init__(self, material: Material):
+    __slots__ = ("material", "length", "area", "second_moment_of_area_xx",
+                 "second_moment_of_area_yy", "squash_load")
+
+    def __init__(self, material: Material, length, area, second_moment_of_area_xx, second_moment_of_area_yy):
         self.material = material
+        self.length = length
+        self.area = area
+        self.second_moment_of_area_xx = second_moment_of_area_xx
+        self.second_moment_of_area_yy = second_moment_of_area_yy
+        # Squash/yielding load of beam [N]
+        self.squash_load = material.yield_stress * area
 
-    @cached_property
+    @property
     def volume(self):
         """
         Returns volume of beam [m^3] if `area` and `length` are defined.
@@ -54,7 +69,7 @@ class Beam:
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
+    @property
     def mass(self):
         """
         Returns mass of beam [kg] if `volume` is defined.
@@ -64,7 +79,7 @@ class Beam:
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
+    @property
     def cost(self):
         """
         Returns cost of beam [$] if `mass` is defined.
@@ -74,7 +89,7 @@ class Beam:
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
+    @property
     def total_embodied_energy(self):
         """
         Returns embodied energy of beam [J] if `mass` is defined.
@@ -84,21 +99,21 @@ class Beam:
         except (AttributeError, TypeError):
             return None
     
-    @cached_property
+    @property
     def embodied_energy_cost(self):
         try:
             return self.total_embodied_energy * self.material.electricity_cost
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
+    @property
     def total_cost(self):
         try:
             return self.cost + self.embodied_energy_cost
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
+    @property
     def buckling_load(self):
         """
         Returns buckling load (minimum of XX and YY axes) of beam [N] if 
@@ -118,16 +133,6 @@ class Beam:
         except (AttributeError, TypeError):
             return None
 
-    @cached_property
-    def squash_load(self):
-        """
-        Returns squash/yielding load of beam [N] if `area` is defined.
-        """
-        try:
-            return self.material.yield_stress * self.area
-        except (AttributeError, TypeError):
-            return None
-
     def get_strain(self, loading):
         """
         Returns strain on beam if `area` is defined.
@@ -148,13 +153,59 @@ class Beam:
 
         Returns `True` if the beam would NOT fail (i.e. IS sufficient), `False` 
         otherwise.
+
+        The checks are done cheapest first, and we give up as soon as one
+        fails. Strain and squash load only need `area`, whereas buckling load
+        needs both second moments of area, so buckling gets checked last.
         """
         try:
-            strain = self.get_strain(loading)
-            return self.squash_load >= loading and self.buckling_load >= loading and strain <= self.material.elongation
+            if self.get_strain(loading) > self.material.elongation:
+                return False
+            if self.squash_load < loading:
+                return False
+            return self.buckling_load >= loading
         except (AttributeError, TypeError):
             return None
 
+    def report(self, loading):
+        """
+        Returns a dict of every quantity we'd want to report about this beam
+        under the given `loading` [N]: `area`, the second moments of area,
+        `volume`, `mass`, `cost`, `total_embodied_energy`,
+        `embodied_energy_cost`, `total_cost`, `buckling_load`, `squash_load` and
+        `strain` (all in the same units as the corresponding properties).
+
+        Gives the same numbers as the individual properties, but works them all
+        out in one go (rather than each property walking back through
+        `volume -> mass -> ...` and looking up the material again).
+        """
+        material = self.material
+        area = self.area
+        min_I = min(self.second_moment_of_area_xx,
+                    self.second_moment_of_area_yy)
+
+        volume = area * self.length
+        mass = volume * material.density
+        cost = mass * material.price
+        total_embodied_energy = mass * material.energy_density
+        embodied_energy_cost = total_embodied_energy * material.electricity_cost
+
+        return {
+            "area": area,
+            "second_moment_of_area_xx": self.second_moment_of_area_xx,
+            "second_moment_of_area_yy": self.second_moment_of_area_yy,
+            "volume": volume,
+            "mass": mass,
+            "cost": cost,
+            "total_embodied_energy": total_embodied_energy,
+            "embodied_energy_cost": embodied_energy_cost,
+            "total_cost": cost + embodied_energy_cost,
+            # Assume pin-pin connection (i.e. effective length = 1 * length)
+            "buckling_load": math.pi**2 * material.modulus * min_I / self.length ** 2,
+            "squash_load": self.squash_load,
+            "strain": loading / area / material.modulus,
+        }
+
     def get_new_best_beam(self, loading, curr_best_beam):
         """
         Compares this beam with the current best beam. Returns this beam if
@@ -171,7 +222,7 @@ class Beam:
                 curr_best_beam = self
 
             if self.area < curr_best_beam.area:
-                best_beam = self
+                curr_best_beam = self
             elif self.area == curr_best_beam.area:
                 # Compare moments of inertia. If this beam is
                 # bigger in every way for same area, might as well
@@ -193,6 +244,8 @@ class RHSBeam(Beam):
     A Rectangular Hollow Section (RHS) beam.
     """
 
+    __slots__ = ("b", "h", "t")
+
     def __init__(self, material: Material, length, b, h, t):
         """
         Parameters
@@ -208,35 +261,34 @@ class RHSBeam(Beam):
         t: int or float
             The thickness [m] of the walls of this beam.
         """
-        super().__init__(material)
-
-        self.length = length
         self.b = b
         self.h = h
         self.t = t
 
-    @cached_property
-    def area(self):
-        return self.b*self.h - (self.b - 2*self.t) * (self.h - 2*self.t)
-
-    @cached_property
-    def second_moment_of_area_xx(self):
-        b, h, t = self.b, self.h, self.t
+        area = b*h - (b - 2*t) * (h - 2*t)
 
         I_big = b * h**3 / 12
         I_small = (b - 2*t)*(h - 2*t)**3 / 12
-        return I_big - I_small
-
-    @cached_property
-    def second_moment_of_area_yy(self):
-        b, h, t = self.b, self.h, self.t
+        I_xx = I_big - I_small
 
         I_big = h * b**3 / 12
         I_small = (h - 2*t)*(b - 2*t)**3 / 12
-        return I_big - I_small
+        I_yy = I_big - I_small
+
+        super().__init__(material, length, area, I_xx, I_yy)
+
+    def report(self, loading):
+        """
+        Same as `Beam.report()`, but also includes this beam's dimensions.
+        """
+        report = super().report(loading)
+        report.update(b=self.b, h=self.h, t=self.t)
+        return report
 
 
 class CHSBeam(Beam):
+    __slots__ = ("r", "t")
+
     def __init__(self, material: Material, length, r, t):
         """
         Parameters
@@ -251,26 +303,23 @@ class CHSBeam(Beam):
         t: int or float
             The thickness [m] of the walls of this beam.
         """
-        super().__init__(material)
-
-        self.length = length
         self.r = r
         self.t = t
 
-    @cached_property
-    def area(self):
-        r, t = self.r, self.t
         # Simplified calcuation for area of CHS
-        return math.pi * (2 * r * t - t**2)
+        area = math.pi * (2 * r * t - t**2)
+        I = math.pi / 4 * (r**4 - (r - t)**4)
 
-    @cached_property
-    def second_moment_of_area_xx(self):
-        return math.pi / 4 * (self.r**4 - (self.r - self.t)**4)
+        # By symmetry, I_xx == I_yy
+        super().__init__(material, length, area, I, I)
 
-    @cached_property
-    def second_moment_of_area_yy(self):
-        # By symmetry
-        return self.second_moment_of_area_xx
+    def report(self, loading):
+        """
+        Same as `Beam.report()`, but also includes this beam's dimensions.
+        """
+        report = super().report(loading)
+        report.update(r=self.r, t=self.t)
+        return report
 
 
 class IBeam(Beam):
@@ -278,6 +327,8 @@ class IBeam(Beam):
     An I-beam (sometimes known as H-beam too).
     """
 
+    __slots__ = ("b", "h", "tw", "tf")
+
     def __init__(self, material: Material, length, b, h, tw, tf):
         """
         Parameters
@@ -297,35 +348,34 @@ class IBeam(Beam):
         tf: int or float
             The thickness [m] of the flanges of this beam.
         """
-        super().__init__(material)
-
-        self.length = length
         self.b = b
         self.h = h
         self.tw = tw
         self.tf = tf
 
-    @cached_property
-    def area(self):
-        a_flanges = 2 * self.b * self.tf
-        a_web = self.tw * (self.h - 2 * self.tf)
-        return a_flanges + a_web
+        a_flanges = 2 * b * tf
+        a_web = tw * (h - 2 * tf)
+        area = a_flanges + a_web
 
-    @cached_property
-    def second_moment_of_area_xx(self):
         # We represent the I-beam as a large rectangle minus two rectangles
         # either side.
-        I_big = self.b * self.h**3 / 12
-        b_small = (self.b - self.tw) / 2
-        h_small = self.h - 2 * self.tf
+        I_big = b * h**3 / 12
+        b_small = (b - tw) / 2
+        h_small = h - 2 * tf
         I_small = b_small * h_small**3 / 12
-        I = I_big - 2 * I_small
-        return I
+        I_xx = I_big - 2 * I_small
 
-    @cached_property
-    def second_moment_of_area_yy(self):
         # Break beam up into its two flanges plus its web
-        I_flange = self.tf * self.b**3 / 12
-        I_web = (self.h - 2*self.tf) * self.tw**3 / 12
-        I = 2 * I_flange + I_web
-        return I
+        I_flange = tf * b**3 / 12
+        I_web = (h - 2*tf) * tw**3 / 12
+        I_yy = 2 * I_flange + I_web
+
+        super().__init__(material, length, area, I_xx, I_yy)
+
+    def report(self, loading):
+        """
+        Same as `Beam.report()`, but also includes this beam's dimensions.
+        """
+        report = super().report(loading)
+        report.update(b=self.b, h=self.h, tw=self.tw, tf=self.tf)
+        return report
@@ -1,4 +1,8 @@
 import csv
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from beams import IBeam, RHSBeam, CHSBeam, Material
 
@@ -15,6 +19,17 @@ GIGA = 10**9
 YIELD_STRESS, MODULUS, ELONGATION, DENSITY, PRICE, ENERGY = range(
     0, 6)
 
+# What to multiply each of those columns by to get them into SI units, so we
+# can avoid headaches later (same order as the indices above)
+UNIT_CONVERSIONS = (
+    MEGA,  # Yield stress: [MPa] -> [Pa]
+    GIGA,  # Modulus: [GPa] -> [Pa]
+    1 / 100,  # Elongation: [%] -> [actual number]
+    10**3,  # Density: [tonnes/m^3] -> [kg/m^3]
+    1,  # Price: already in [$/kg]
+    MEGA,  # Embodied energy: [MJ/kg] -> [J/kg]
+)
+
 # Defining variables related to shape/loading of beam
 length = 2000 * MILLI  # [m]
 loading = 24 * KILO  # [N]
@@ -25,93 +40,471 @@ max_height = 100 * MILLI  # [m]
 # mm precision, so that's what we'll use!
 step_size = 1 * MILLI  # [m]
 
-##################### READING MATERIAL DATA FROM CSV FILE #####################
-# Reading Table 1 csv file into numpy array (ignoring headers)
-with open("part2_table1.csv", "r") as csvfile:
-    reader = csv.reader(csvfile)
-
-    rows = [row for row in reader]
-    data = np.array(rows[1:])
-    # Take out materials so we can cast everything else to floats
-    materials = data[:, 0]
-    # Convert data from strings to floats
-    data = data[:, 1:].astype(float)
-
-# Converting units in data array to avoid headaches later
-data[:, YIELD_STRESS] *= MEGA  # [MPa] -> [Pa]
-data[:, MODULUS] *= GIGA  # [GPa] -> [Pa]
-data[:, ELONGATION] /= 100  # [%] to [actual number]
-data[:, DENSITY] *= 10**3  # [tonnes] -> [kg]
-data[:, ENERGY] *= MEGA  # [MJ/kg] -> [J/kg]
-
-### DEFINING NESTED FOR LOOPS FOR EACH CROSS-SECTION TO DETERMINE BEST BEAM ###
-
-
-def get_best_I_beam(material: Material):
-    best_I_beam = None
-
-    for b in np.arange(step_size, max_breadth + step_size, step_size):
-        for h in np.arange(step_size, max_height + step_size, step_size):
-            for tw in np.arange(step_size, b + step_size, step_size):
-                for tf in np.arange(step_size, h/2 + step_size, step_size):
-                    beam = IBeam(material, length, b, h, tw, tf)
-                    best_I_beam = beam.get_new_best_beam(loading, best_I_beam)
-
-    return best_I_beam
+# The searches below count every dimension in whole numbers of steps (rather
+# than np.arange-ing over metres), so floating-point error can never sneak an
+# extra step onto the end of a range. Convert back to metres with `step_size`.
+max_breadth_steps = round(max_breadth / step_size)
+max_height_steps = round(max_height / step_size)
 
+##################### READING MATERIAL DATA FROM CSV FILE #####################
+# Reading Table 1 csv file straight into a numpy structured array, with one
+# field per column (the first row is the headers). The file starts with a
+# byte-order mark, hence 'utf-8-sig'.
+table = np.genfromtxt("part2_table1.csv", delimiter=",", names=True,
+                      dtype=None, encoding="utf-8-sig")
+
+# Take out materials, then stack every other column (converted to SI units)
+# into one 2D array of floats
+materials = table[table.dtype.names[0]]
+data = np.stack([table[field] * conversion for field, conversion
+                 in zip(table.dtype.names[1:], UNIT_CONVERSIONS)], axis=1)
+
+########## WORKING OUT THE GEOMETRY OF EVERY POSSIBLE BEAM, BIT BY BIT ##########
+# Rather than constructing a Beam object for every single combination of
+# dimensions, we build a grid of every combination with np.meshgrid and
+# evaluate the formulas from beams.py on the whole grid at once. Only the
+# winning beam gets turned into an actual Beam object at the end.
+#
+# We don't build the whole grid for a cross-section in one go though. Instead,
+# we build it one slice at a time (e.g. every I-beam with one particular
+# breadth), and search that slice for the best beam for every single material
+# before moving on. So each slice's geometry only gets worked out once (a
+# beam's area and second moments of area don't depend on its material), and we
+# only ever need to hold a slice's worth of beams in memory at once, no matter
+# how finely we step through the dimensions.
+#
+# Once a slice's grid is worked out, we throw away every combination of
+# dimensions that doesn't actually make sense, and flatten what's left into
+# plain 1D arrays (one per dimension/property, all lined up with each other).
+# Searching these is just a couple of linear scans through contiguous memory.
+#
+# NOTE: Everything in here is measured in steps, not metres (so areas are in
+# steps^2, second moments of area in steps^4, etc.)
+#
+# We're careful to only allocate a full-sized array when we have to. Anything
+# that only depends on a couple of dimensions gets worked out before it's
+# broadcast up to the full grid, and we update arrays in-place where we can.
+#
+# We also store the flattened arrays as compactly as we can, since every
+# material's search has to read through all of them: dimensions as the smallest
+# integer type that fits, and areas/second moments of area as 32-bit floats.
+# The geometry is still worked out in 64-bit floats and only rounded once at
+# the end, and a 32-bit float has ~7 significant figures, which is plenty for
+# mm precision (areas are whole numbers of steps^2, which it stores exactly).
+# The winning beam gets built from its dimensions in full precision anyway.
+
+# `dimensions` is a tuple with a 1D array [steps] for each dimension of the
+# beam, lined up with the 1D arrays of `area`, `I_xx` and `I_yy`.
+#
+# The last dimension of every cross-section is a thickness (tf for I-beams, t
+# otherwise), and beams that only differ in that thickness are stored next to
+# each other, thinnest first. `run_starts`/`run_ends` give the indices where
+# each of these runs of beams starts/ends (exclusive).
+Geometry = namedtuple(
+    "Geometry", ("dimensions", "area", "I_xx", "I_yy", "run_starts", "run_ends"))
+
+dimension_dtype = np.min_scalar_type(max(max_breadth_steps, max_height_steps))
+
+# Values [steps] of the dimension that each cross-section gets sliced along
+breadths = np.arange(1, max_breadth_steps + 1)
+# We obviously lose a lot of our possible envelope by using a circular
+# cross-section. Restrict to minimum dimensions (should be 30mm).
+radii = np.arange(1, min(max_breadth_steps, max_height_steps) // 2 + 1)
+
+
+def flatten_geometry(grids, area, I_xx, I_yy, is_valid):
+    """
+    Returns the `Geometry` of only the valid beams in the given grids (which
+    just need to broadcast against `is_valid`, and have the thickness that runs
+    are made of as their last axis).
+    """
+    dimensions = tuple(np.broadcast_to(grid, is_valid.shape)[is_valid].astype(dimension_dtype)
+                       for grid in grids)
+    area, I_xx, I_yy = (grid[is_valid].astype(np.float32) for grid in (area, I_xx, I_yy))
+
+    run_lengths = np.atleast_1d(is_valid.sum(axis=-1)).ravel()
+    run_lengths = run_lengths[run_lengths > 0]
+    run_ends = np.cumsum(run_lengths)
+    run_starts = run_ends - run_lengths
+
+    return Geometry(dimensions, area, I_xx, I_yy, run_starts, run_ends)
+
+
+def get_I_beam_geometry(b):
+    """
+    Returns the `Geometry` of every I-beam with breadth `b` [steps], with
+    dimensions `(b, h, tw, tf)`.
+    """
+    heights = np.arange(1, max_height_steps + 1)
+    # Web can't be wider than the flanges
+    web_thicknesses = np.arange(1, b + 1)
+    flange_thicknesses = np.arange(1, max_height_steps // 2 + 1)
+
+    # Sparse grids just broadcast against each other, so only the derived
+    # quantities ever take up the full grid's worth of memory
+    h, tw, tf = np.meshgrid(
+        heights, web_thicknesses, flange_thicknesses, indexing="ij", sparse=True)
+
+    web_height = h - 2 * tf
+
+    area = tw * web_height + 2 * b * tf
+    # Big rectangle minus the two rectangles either side of the web
+    I_xx = (b - tw) * (web_height**3 / 12)
+    np.subtract(b * h**3 / 12, I_xx, out=I_xx)
+    # Two flanges plus the web
+    I_yy = web_height * (tw**3 / 12) + 2 * tf * b**3 / 12
+
+    # Flanges can't be taller than the whole beam
+    is_valid = np.broadcast_to(web_height >= 0, area.shape)
+
+    return flatten_geometry((b, h, tw, tf), area, I_xx, I_yy, is_valid)
+
+
+def get_RHS_beam_geometry(b):
+    """
+    Returns the `Geometry` of every RHS-beam with breadth `b` [steps], with
+    dimensions `(b, h, t)`.
+    """
+    heights = np.arange(1, max_height_steps + 1)
+    # Walls' thickness is constrained by overall breadth/height of beam
+    thicknesses = np.arange(1, b // 2 + 1)
+
+    h, t = np.meshgrid(heights, thicknesses, indexing="ij", sparse=True)
+
+    inner_b = b - 2 * t
+    inner_h = h - 2 * t
+
+    # Big rectangle minus the hollow inside
+    area = inner_b * inner_h
+    np.subtract(b * h, area, out=area)
+    I_xx = inner_b * inner_h**3 / 12
+    np.subtract(b * h**3 / 12, I_xx, out=I_xx)
+    I_yy = inner_h * inner_b**3 / 12
+    np.subtract(h * b**3 / 12, I_yy, out=I_yy)
+
+    is_valid = inner_h >= 0
+
+    return flatten_geometry((b, h, t), area, I_xx, I_yy, is_valid)
+
+
+def get_CHS_beam_geometry(r):
+    """
+    Returns the `Geometry` of every CHS-beam with radius `r` [steps], with
+    dimensions `(r, t)`.
+    """
+    # Walls can be as thick as the whole radius (i.e. a solid bar)
+    t = np.arange(1, r + 1)
+
+    area = math.pi * (2 * r * t - t**2)
+    # By symmetry, I_xx == I_yy
+    I = math.pi / 4 * (r**4 - (r - t)**4)
+
+    is_valid = np.full(area.shape, True)
+
+    return flatten_geometry((r, t), area, I, I, is_valid)
+
+
+############ DEFINING VECTORISED SEARCHES FOR EACH CROSS-SECTION ############
+
+
+def get_best_index(sufficient, area, I_xx, I_yy):
+    """
+    Returns the index (into the given 1D arrays) of the beam with the smallest
+    area out of the sufficient beams at (sorted) indices `sufficient`, breaking
+    ties by picking the beam with the largest `I_xx + I_yy` (and then the first
+    beam). Returns `None` if no beam is sufficient.
+    """
+    if len(sufficient) == 0:
+        return None
+
+    sufficient_area = area[sufficient]
+    # Dimensions are whole numbers of steps, so tied areas really are equal
+    tied = sufficient[sufficient_area == sufficient_area.min()]
+    tied_I = I_xx[tied] + I_yy[tied]
+    return tied[np.argmax(tied_I)]
+
+
+# The minimum area [steps^2] and second moments of area [steps^4] a beam needs
+# to be sufficient for one particular material (see `get_thresholds()`)
+Thresholds = namedtuple("Thresholds", ("min_area", "min_I"))
+
+
+def get_thresholds(material: Material):
+    """
+    Returns the `Thresholds` a beam made of `material` has to meet to be
+    sufficient.
+
+    Rather than working out the buckling load, squash load and strain of every
+    single beam, we rearrange each check in `Beam.is_sufficient()` into a
+    minimum area or second moment of area. These only depend on the material,
+    so we work them out once per material, before searching through any beams.
+    """
+    # Buckling: pi^2 * E * min_I / L^2 >= loading
+    min_I = loading * length**2 / (math.pi**2 * material.modulus)
+    # Squashing: yield_stress * area >= loading
+    min_area = loading / material.yield_stress
+    # Strain: loading / (area * E) <= elongation. No amount of area can help a
+    # material with no elongation at all though!
+    if material.elongation > 0:
+        min_area = max(min_area, loading /
+                       (material.modulus * material.elongation))
+    else:
+        min_area = np.inf
+
+    # Convert from [m^2] and [m^4] to steps
+    return Thresholds(min_area / step_size**2, min_I / step_size**4)
+
+
+def get_is_sufficient(thresholds: Thresholds, area, I_xx, I_yy):
+    """
+    Array version of `Beam.is_sufficient()` for a material with the given
+    `thresholds`, for the given grids of areas [steps^2] and second moments of
+    area [steps^4] (which just need to broadcast against each other, as long as
+    `area` isn't the biggest).
+    """
+    # Checking both second moments separately means we never need a full-sized
+    # array of the smaller one
+    is_sufficient = I_xx >= thresholds.min_I
+    is_sufficient &= I_yy >= thresholds.min_I
+    is_sufficient &= area >= thresholds.min_area
+    return is_sufficient
+
+
+def get_smallest_possible_breadth(thresholds: Thresholds):
+    """
+    Returns the smallest breadth [steps] that could possibly give a sufficient
+    I-beam or RHS-beam for a material with the given `thresholds`, or `None`
+    if no beam could be sufficient at all.
+
+    An I-beam or RHS-beam always fits inside the solid rectangle with the same
+    breadth and height, so it can never have more area or second moment of area
+    than that rectangle. If even the solid rectangle isn't sufficient for any
+    height, then there's no point searching through any beams with that
+    breadth. Since the solid rectangle only gets stronger as it gets bigger,
+    every breadth from this one upwards is worth searching.
+    """
+    heights = np.arange(1, max_height_steps + 1)
+
+    b, h = np.meshgrid(breadths, heights, indexing="ij", sparse=True)
+    could_be_sufficient = get_is_sufficient(
+        thresholds, b * h, b * h**3 / 12, h * b**3 / 12)
+    if not could_be_sufficient.any():
+        return None
+
+    return breadths[could_be_sufficient.any(axis=1)][0]
+
+
+def get_smallest_possible_radius(thresholds: Thresholds):
+    """
+    Returns the smallest radius [steps] that could possibly give a sufficient
+    CHS-beam for a material with the given `thresholds`, or `None` if no beam
+    could be sufficient at all.
+
+    Same idea as `get_smallest_possible_breadth()`: a CHS-beam can never be any
+    stronger than the solid circle with the same radius.
+    """
+    could_be_sufficient = get_is_sufficient(
+        thresholds, math.pi * radii**2, math.pi / 4 * radii**4, math.pi / 4 * radii**4)
+    if not could_be_sufficient.any():
+        return None
+
+    return radii[could_be_sufficient][0]
+
+
+def get_thinnest_sufficient_indices(geometry: Geometry, thresholds: Thresholds):
+    """
+    Returns the indices of the thinnest sufficient beam in each run of
+    `geometry` (skipping runs without any sufficient beams), for a material with
+    the given `thresholds`.
+
+    Making a beam's walls/flanges thicker only ever adds material to it, so its
+    area and both second moments of area can only go up. That means that along
+    each run, the beams go from insufficient to sufficient exactly once, and
+    the thinnest sufficient beam is the only one that could possibly be the
+    best. So rather than checking every beam in the run, we binary search for
+    that thinnest one (for all the runs at once).
+    """
+    # If even the thickest beam in a run isn't sufficient, none of them are, so
+    # don't bother searching that run at all
+    last = geometry.run_ends - 1
+    has_sufficient = get_is_sufficient(
+        thresholds, geometry.area[last], geometry.I_xx[last], geometry.I_yy[last])
+
+    # Every beam before `lo` is insufficient, and every beam from `hi` onwards
+    # (up to the end of the run) is sufficient
+    lo = geometry.run_starts[has_sufficient]
+    hi = last[has_sufficient]
+    while True:
+        is_searching = lo < hi
+        if not is_searching.any():
+            break
+
+        mid = (lo + hi) // 2
+        is_sufficient = get_is_sufficient(
+            thresholds, geometry.area[mid], geometry.I_xx[mid], geometry.I_yy[mid])
+
+        hi = np.where(is_searching & is_sufficient, mid, hi)
+        lo = np.where(is_searching & ~is_sufficient, mid + 1, lo)
+
+    return lo
+
+
+def search_geometry(geometry: Geometry, thresholds: Thresholds):
+    """
+    Returns `(area, I_xx + I_yy, dimensions)` of the best beam in the given
+    `geometry` for a material with the given `thresholds`, or `None` if no beam
+    is sufficient.
+    """
+    sufficient = get_thinnest_sufficient_indices(geometry, thresholds)
+    index = get_best_index(sufficient, geometry.area,
+                           geometry.I_xx, geometry.I_yy)
+    if index is None:
+        return None
+
+    I_sum = geometry.I_xx[index] + geometry.I_yy[index]
+    return geometry.area[index], I_sum, tuple(dimension[index] for dimension in geometry.dimensions)
+
+
+def search_slice(get_geometry, value, all_thresholds, smallest_values):
+    """
+    Works out the `Geometry` of one slice of beams with `get_geometry(value)`,
+    and returns a list with the result of `search_geometry()` on that slice for
+    every material (with `Thresholds`) in `all_thresholds`.
+
+    Materials whose entry in `smallest_values` is `None` or bigger than `value`
+    can't possibly have a sufficient beam in this slice, so we don't bother
+    searching it for them (and just give `None`).
+    """
+    geometry = get_geometry(value)
+
+    return [search_geometry(geometry, thresholds)
+            if smallest is not None and value >= smallest else None
+            for thresholds, smallest in zip(all_thresholds, smallest_values)]
+
+
+def search_beams(get_geometry, values, all_thresholds, smallest_values):
+    """
+    Returns a list with the dimensions [steps] of the best beam (or `None` if
+    no beam is sufficient) for every material in `all_thresholds`, searching
+    through the slices given by `get_geometry(value)` for every one of `values`.
+    See `search_slice()`.
+
+    Every slice is independent of the others, and NumPy releases the GIL while
+    it crunches through them, so we search the slices on a pool of threads.
+    `map()` gives back each slice's results in order, so we keep a running best
+    beam for each material, with the same tie-breaking as `get_best_index()`
+    (i.e. ties go to the earliest beam).
+
+    Slices before every material's smallest value can't have a sufficient beam
+    for anything, so we don't even work out their geometry. If no material
+    could possibly have a sufficient beam (e.g. every CHS-beam under a heavy
+    load), we skip the whole search.
+    """
+    best = [None] * len(all_thresholds)
+
+    possible_values = [value for value in smallest_values if value is not None]
+    if not possible_values:
+        return best
+    values = values[values >= min(possible_values)]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        slice_results = pool.map(
+            lambda value: search_slice(
+                get_geometry, value, all_thresholds, smallest_values),
+            values)
+
+        for results in slice_results:
+            for i, result in enumerate(results):
+                if result is None:
+                    continue
+                if best[i] is None or result[0] < best[i][0] or (result[0] == best[i][0] and result[1] > best[i][1]):
+                    best[i] = result
+
+    return [None if result is None else result[2] for result in best]
+
+
+def get_best_I_beams(all_materials):
+    """
+    Returns a list with the best `IBeam` (or `None` if no I-beam is sufficient)
+    for every `Material` in `all_materials`.
+    """
+    all_thresholds = [get_thresholds(material) for material in all_materials]
+    smallest_breadths = [get_smallest_possible_breadth(thresholds)
+                         for thresholds in all_thresholds]
+    all_dimensions = search_beams(
+        get_I_beam_geometry, breadths, all_thresholds, smallest_breadths)
+
+    return [None if dimensions is None else IBeam(material, length, *(d * step_size for d in dimensions))
+            for material, dimensions in zip(all_materials, all_dimensions)]
+
+
+def get_best_RHS_beams(all_materials):
+    """
+    Returns a list with the best `RHSBeam` (or `None` if no RHS-beam is
+    sufficient) for every `Material` in `all_materials`.
+    """
+    all_thresholds = [get_thresholds(material) for material in all_materials]
+    smallest_breadths = [get_smallest_possible_breadth(thresholds)
+                         for thresholds in all_thresholds]
+    all_dimensions = search_beams(
+        get_RHS_beam_geometry, breadths, all_thresholds, smallest_breadths)
+
+    return [None if dimensions is None else RHSBeam(material, length, *(d * step_size for d in dimensions))
+            for material, dimensions in zip(all_materials, all_dimensions)]
+
+
+def get_best_CHS_beams(all_materials):
+    """
+    Returns a list with the best `CHSBeam` (or `None` if no CHS-beam is
+    sufficient) for every `Material` in `all_materials`.
+    """
+    all_thresholds = [get_thresholds(material) for material in all_materials]
+    smallest_radii = [get_smallest_possible_radius(thresholds)
+                      for thresholds in all_thresholds]
+    all_dimensions = search_beams(
+        get_CHS_beam_geometry, radii, all_thresholds, smallest_radii)
+
+    return [None if dimensions is None else CHSBeam(material, length, *(d * step_size for d in dimensions))
+            for material, dimensions in zip(all_materials, all_dimensions)]
 
-def get_best_RHS_beam(material: Material):
-    best_RHS_beam = None
 
-    for b in np.arange(step_size, max_breadth + step_size, step_size):
-        for h in np.arange(step_size, max_height + step_size, step_size):
-            # Walls' thickness is constrained by overall breadth/height of beam
-            min_dimension = min(b, h)
-            for t in np.arange(step_size, min_dimension / 2 + step_size, step_size):
-                beam = RHSBeam(material, length, b, h, t)
-                best_RHS_beam = beam.get_new_best_beam(loading, best_RHS_beam)
+### GOING THROUGH EVERY MATERIAL, FINDING BEST BEAMS FOR EACH CROSS-SECTION ###
 
-    return best_RHS_beam
 
+def get_material(i):
+    """
+    Returns the `Material` for row `i` of `data`.
+    """
+    # Getting properties of this material
+    yield_stress = data[i, YIELD_STRESS]
+    modulus = data[i, MODULUS]
+    elongation = data[i, ELONGATION]
+    density = data[i, DENSITY]
+    price = data[i, PRICE]
+    energy_density = data[i, ENERGY]
 
-def get_best_CHS_beam(material: Material):
-    best_CHS_beam = None
-    min_dimension = min(max_breadth, max_height)
+    # Creating Material class
+    return Material(materials[i], yield_stress, modulus,
+                    elongation, density, price, energy_density)
 
-    # We obviously lose a lot of our possible envelope by using a circular
-    # cross-section. Restrict to minimum dimensions (should be 30mm).
-    for r in np.arange(step_size, min_dimension / 2 + step_size, step_size):
-        for t in np.arange(step_size, r + step_size, step_size):
-            beam = CHSBeam(material, length, r, t)
-            best_CHS_beam = beam.get_new_best_beam(loading, best_CHS_beam)
 
-    return best_CHS_beam
+all_materials = [get_material(i) for i in range(len(materials))]
 
+# Each of these searches every material at once, so we get a list of the best
+# beam for each material (in the same order as `all_materials`)
+results = zip(all_materials, get_best_I_beams(all_materials),
+              get_best_RHS_beams(all_materials), get_best_CHS_beams(all_materials))
 
-### GOING THROUGH EVERY MATERIAL, FINDING BEST BEAMS FOR EACH CROSS-SECTION ###
 # Arrays to store best beams for each material (note we only add materials if
 # they are actually suitable, otherwise we ignore them. This leads to CHS array
 # only having one element!)
 best_I_beams = []
 best_RHS_beams = []
 best_CHS_beams = []
-for i, material_name in enumerate(materials):
-    print(f"MATERIAL: {material_name}")
-
-    # Getting properties of this material
-    yield_stress = data[i, YIELD_STRESS]
-    modulus = data[i, MODULUS]
-    elongation = data[i, ELONGATION]
-    density = data[i, DENSITY]
-    price = data[i, PRICE]
-    energy_density = data[i, ENERGY]
-
-    # Creating Material class
-    material = Material(material_name, yield_stress, modulus,
-                        elongation, density, price, energy_density)
+for material, best_I_beam, best_RHS_beam, best_CHS_beam in results:
+    print(f"MATERIAL: {material.name}")
 
     # Checking I-beams
-    best_I_beam = get_best_I_beam(material)
     if best_I_beam is not None:
         best_I_beams.append(best_I_beam)
         print("    Found suitable I-beam!")
@@ -119,7 +512,6 @@ for i, material_name in enumerate(materials):
         print("    No suitable I-beam!")
 
     # Checking RHS beams
-    best_RHS_beam = get_best_RHS_beam(material)
     if best_RHS_beam is not None:
         best_RHS_beams.append(best_RHS_beam)
         print("    Found suitable RHS-beam!")
@@ -127,7 +519,6 @@ for i, material_name in enumerate(materials):
         print("    No suitable RHS-beam!")
 
     # Checking CHS beams
-    best_CHS_beam = get_best_CHS_beam(material)
     if best_CHS_beam is not None:
         best_CHS_beams.append(best_CHS_beam)
         print("    Found suitable CHS-beam!")
@@ -138,41 +529,56 @@ for i, material_name in enumerate(materials):
 # NOTE: We do some unit conversions here so the results are easier to read in
 # the csv files/spreadsheets!
 
-# Writing I-beams to file
-with open("part2_results/I_beams.csv", "w+") as csvfile:
-    writer = csv.writer(csvfile, dialect="excel")
 
-    headers = ("Material", "Area [mm^2]", "Breadth [mm]", "Height [mm]", "Web thickness [mm]", "Flange thickness [mm]",
-               "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Embodied energy [MJ]", "Cost [$]", "Embodied energy cost [$]", "Total cost [$]")
-    writer.writerow(headers)
+def get_column(reports, key, unit=1):
+    """
+    Returns a numpy array of `key` from every beam report in `reports` (see
+    `Beam.report()`), converted to the given `unit` (e.g. `MILLI**2` to get
+    areas in [mm^2]).
+    """
+    return np.array([report[key] for report in reports], dtype=float) / unit
 
-    for beam in best_I_beams:
-        row = (beam.material.name, beam.area/MILLI**2, beam.b/MILLI, beam.h/MILLI, beam.tw/MILLI, beam.tf/MILLI, beam.second_moment_of_area_xx/MILLI**4,
-               beam.second_moment_of_area_yy/MILLI**4, beam.buckling_load/KILO, beam.squash_load/KILO, beam.get_strain(loading), beam.total_embodied_energy/MEGA, beam.cost, beam.embodied_energy_cost, beam.total_cost)
-        writer.writerow(row)
 
-# Writing RHS-beams to file
-with open("part2_results/RHS_beams.csv", "w+") as csvfile:
-    writer = csv.writer(csvfile, dialect="excel")
+def write_beams(path, headers, beams, columns):
+    """
+    Writes `headers`, then a row for every beam in `beams`, to the csv file at
+    `path`. Each row starts with the beam's material name, followed by every
+    `(key, unit)` in `columns` (see `get_column()`).
 
-    headers = ("Material", "Area [mm^2]", "Breadth [mm]", "Height [mm]", "Wall thickness [mm]",
-               "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Embodied energy [MJ]", "Cost [$]", "Embodied energy cost [$]", "Total cost [$]")
-    writer.writerow(headers)
+    Every beam's report gets worked out before the file is even opened, so all
+    the rows go out in one `writerows()` call.
+    """
+    reports = [beam.report(loading) for beam in beams]
+    names = [beam.material.name for beam in beams]
+    rows = zip(names, *(get_column(reports, key, unit)
+               for key, unit in columns))
 
-    for beam in best_RHS_beams:
-        row = (beam.material.name, beam.area/MILLI**2, beam.b/MILLI, beam.h/MILLI, beam.t/MILLI, beam.second_moment_of_area_xx/MILLI**4,
-               beam.second_moment_of_area_yy/MILLI**4, beam.buckling_load/KILO, beam.squash_load/KILO, beam.get_strain(loading), beam.total_embodied_energy/MEGA, beam.cost, beam.embodied_energy_cost, beam.total_cost)
-        writer.writerow(row)
+    with open(path, "w+") as csvfile:
+        writer = csv.writer(csvfile, dialect="excel")
+        writer.writerow(headers)
+        writer.writerows(rows)
 
-# Writing CHS-beams to file
-with open("part2_results/CHS_beams.csv", "w+") as csvfile:
-    writer = csv.writer(csvfile, dialect="excel")
 
-    headers = ("Material", "Area [mm^2]", "Radius [mm]", "Wall thickness [mm]",
-               "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Cost [$]", "Embodied energy [MJ]", "Embodied energy cost [$]", "Total cost [$]", )
-    writer.writerow(headers)
+# Writing I-beams to file
+write_beams("part2_results/I_beams.csv",
+            ("Material", "Area [mm^2]", "Breadth [mm]", "Height [mm]", "Web thickness [mm]", "Flange thickness [mm]",
+             "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Embodied energy [MJ]", "Cost [$]", "Embodied energy cost [$]", "Total cost [$]"),
+            best_I_beams,
+            (("area", MILLI**2), ("b", MILLI), ("h", MILLI), ("tw", MILLI), ("tf", MILLI), ("second_moment_of_area_xx", MILLI**4),
+             ("second_moment_of_area_yy", MILLI**4), ("buckling_load", KILO), ("squash_load", KILO), ("strain", 1), ("total_embodied_energy", MEGA), ("cost", 1), ("embodied_energy_cost", 1), ("total_cost", 1)))
+
+# Writing RHS-beams to file
+write_beams("part2_results/RHS_beams.csv",
+            ("Material", "Area [mm^2]", "Breadth [mm]", "Height [mm]", "Wall thickness [mm]",
+             "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Embodied energy [MJ]", "Cost [$]", "Embodied energy cost [$]", "Total cost [$]"),
+            best_RHS_beams,
+            (("area", MILLI**2), ("b", MILLI), ("h", MILLI), ("t", MILLI), ("second_moment_of_area_xx", MILLI**4),
+             ("second_moment_of_area_yy", MILLI**4), ("buckling_load", KILO), ("squash_load", KILO), ("strain", 1), ("total_embodied_energy", MEGA), ("cost", 1), ("embodied_energy_cost", 1), ("total_cost", 1)))
 
-    for beam in best_CHS_beams:
-        row = (beam.material.name, beam.area/MILLI**2, beam.r/MILLI, beam.t/MILLI, beam.second_moment_of_area_xx/MILLI**4,
-               beam.second_moment_of_area_yy/MILLI**4, beam.buckling_load/KILO, beam.squash_load/KILO, beam.get_strain(loading), beam.cost, beam.total_embodied_energy/MEGA, beam.embodied_energy_cost, beam.total_cost)
-        writer.writerow(row)
+# Writing CHS-beams to file
+write_beams("part2_results/CHS_beams.csv",
+            ("Material", "Area [mm^2]", "Radius [mm]", "Wall thickness [mm]",
+             "I_xx [mm^4]", "I_yy [mm^4]", "Buckling load [kN]", "Squash load [kN]", "Strain", "Cost [$]", "Embodied energy [MJ]", "Embodied energy cost [$]", "Total cost [$]", ),
+            best_CHS_beams,
+            (("area", MILLI**2), ("r", MILLI), ("t", MILLI), ("second_moment_of_area_xx", MILLI**4),
+             ("second_moment_of_area_yy", MILLI**4), ("buckling_load", KILO), ("squash_load", KILO), ("strain", 1), ("cost", 1), ("total_embodied_energy", MEGA), ("embodied_energy_cost", 1), ("total_cost", 1)))